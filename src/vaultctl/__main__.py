@@ -1,5 +1,20 @@
 """vaultctl 패키지 진입점."""
-from vaultctl.cli import app
+import sys
+
+
+def main() -> None:
+    """Console script entry point / 콘솔 스크립트 진입점."""
+    # Fast path: answer --version before building the Typer command tree
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        from vaultctl import __version__
+
+        print(f"vaultctl {__version__}")
+        return
+
+    from vaultctl.cli import app
 
-if __name__ == "__main__":
     app()
+
+
+if __name__ == "__main__":
+    main()
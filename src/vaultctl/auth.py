@@ -0,0 +1,106 @@
+"""Vault authentication shared by the CLI commands.
+CLI 명령어 공용 Vault 인증.
+
+Credentials are tried in order: cached token, VAULT_TOKEN, AppRole.
+The resulting client is memoized for the process lifetime.
+"""
+
+import functools
+import time
+from typing import Callable, Optional, TypeVar
+
+import typer
+
+from vaultctl.config import settings
+from vaultctl.vault_client import VaultClient, VaultError, get_client
+
+T = TypeVar("T")
+
+# Trust a cached token without probing Vault until this close to its expiry
+TOKEN_EXPIRY_MARGIN = 60
+
+
+@functools.lru_cache(maxsize=1)
+def authenticate() -> Optional[VaultClient]:
+    """Authenticate with cached token, VAULT_TOKEN or AppRole (memoized).
+
+    Returns:
+        Authenticated client, or None if no method succeeded
+    """
+    # The shared client keeps one connection pool for every credential tried
+    client = get_client()
+
+    token, expires_at = settings.read_token_cache()
+    if token:
+        client.set_token(token)
+        # A 401/403 from a token revoked early is handled by with_client()
+        if expires_at is not None and time.time() < expires_at - TOKEN_EXPIRY_MARGIN:
+            return client
+        if client.is_authenticated():
+            return client
+
+    if settings.vault_token:
+        client.set_token(settings.vault_token)
+        if client.is_authenticated():
+            return client
+
+    if settings.has_approle_credentials():
+        try:
+            result = client.approle_login(
+                settings.approle_role_id,
+                settings.approle_secret_id,
+                settings.approle_mount,
+            )
+            auth = result.get("auth") or {}
+            token = auth.get("client_token")
+            if token:
+                try:
+                    settings.ensure_dirs()
+                    settings.write_token_cache(token, auth.get("lease_duration", 0))
+                except PermissionError:
+                    pass
+                client.set_token(token)
+                return client
+        except VaultError:
+            pass
+
+    return None
+
+
+def get_authenticated_client() -> VaultClient:
+    """Get authenticated Vault client, exiting if authentication fails."""
+    client = authenticate()
+    if client is None:
+        from rich.console import Console
+
+        Console().print("[red]✗[/red] Authentication required.\n  Run: vaultctl init")
+        raise typer.Exit(1)
+    return client
+
+
+def token_rejected(client: VaultClient, error: VaultError) -> bool:
+    """Whether error means client's token is no longer valid.
+
+    Vault answers 403 both for dead tokens and for policy denials, so a
+    401/403 only counts once lookup-self fails as well.
+    """
+    return error.status_code in (401, 403) and not client.is_authenticated()
+
+
+def reauthenticate() -> Optional[VaultClient]:
+    """Drop the cached token and run the credential ladder again."""
+    settings.clear_token_cache()
+    authenticate.cache_clear()
+    return authenticate()
+
+
+def with_client(func: Callable[[VaultClient], T]) -> T:
+    """Call func with the authenticated client, re-authenticating once if its token died."""
+    client = get_authenticated_client()
+    try:
+        return func(client)
+    except VaultError as e:
+        if not token_rejected(client, e):
+            raise
+        reauthenticate()
+        return func(get_authenticated_client())
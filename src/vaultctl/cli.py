@@ -13,114 +13,191 @@ Usage (User):
 Usage (Admin):
     vaultctl admin ...         # Administrator commands
 """
-import shutil
-import socket
-from datetime import datetime
+import functools
+import importlib
+import os
+import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
-from ruamel.yaml import YAML
-
-from vaultctl import __version__
-from vaultctl.commands.admin import app as admin_app
-from vaultctl.commands.user.compose import app as compose_app
-from vaultctl.commands.user import extended
-from vaultctl.commands import selfupdate
-from vaultctl.config import settings
-from vaultctl.utils import format_duration, write_env_file, load_env_file
-from vaultctl.vault_client import VaultClient, VaultError
+from typer.core import TyperCommand, TyperGroup
+
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from ruamel.yaml import YAML
+
+    from vaultctl.vault_client import VaultClient
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports subcommand modules only when dispatched.
+
+    Subcommands are declared as ``"module:attribute"`` paths pointing at
+    either a ``typer.Typer`` app or a plain command function, together with
+    the short help shown in ``vaultctl --help``.
+    """
+
+    # name -> (import path, short help); the help must match the command's docstring
+    lazy_commands: dict[str, tuple[str, str]] = {
+        # Extended commands (user-facing)
+        "run": ("vaultctl.commands.user.extended:run_command", "Run process with injected environment variables."),
+        "sh": ("vaultctl.commands.user.extended:shell_export", "Generate shell export statements for eval."),
+        "scan": ("vaultctl.commands.user.extended:scan_secrets", "Scan code for hardcoded secrets from Vault."),
+        "redact": ("vaultctl.commands.user.extended:redact_secrets", "Mask secrets in input and output."),
+        "watch": ("vaultctl.commands.user.extended:watch_and_restart", "Detect secret changes and auto-restart process."),
+        # Self-update / version commands
+        "version": (
+            "vaultctl.commands.selfupdate:version_command",
+            "Print the version, and whether an update is available (if reachable).",
+        ),
+        "self-update": ("vaultctl.commands.selfupdate:self_update_command", "Update vaultctl to the latest version."),
+        # Sub-apps
+        "admin": ("vaultctl.commands.admin:app", "Administrator commands / 관리자 명령어"),
+        "compose": ("vaultctl.commands.user.compose:app", "Docker Compose integration / Docker Compose 통합"),
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loaded: dict[str, Union[TyperCommand, TyperGroup]] = {}
+        self._formatting_help = False
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        # Eager commands keep their original place ahead of the lazy ones
+        return [*super().list_commands(ctx), *self.lazy_commands]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str):
+        if cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+        if cmd_name not in self._loaded:
+            if self._formatting_help:
+                # Help only reads name and short help; don't import for it
+                return TyperCommand(cmd_name, short_help=self.lazy_commands[cmd_name][1])
+            self._loaded[cmd_name] = self._load_command(cmd_name)
+        return self._loaded[cmd_name]
+
+    def format_help(self, ctx: typer.Context, formatter) -> None:
+        self._formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
+
+    def _load_command(self, cmd_name: str) -> Union[TyperCommand, TyperGroup]:
+        module_path, attr = self.lazy_commands[cmd_name][0].split(":")
+        target = getattr(importlib.import_module(module_path), attr)
+        if isinstance(target, typer.Typer):
+            return typer.main.get_group(target)
+        sub_app = typer.Typer(add_completion=False)
+        sub_app.command(cmd_name)(target)
+        return typer.main.get_command(sub_app)
+
 
 app = typer.Typer(
     name="vaultctl",
     help="Simple Vault CLI for LXC environments / LXC 환경을 위한 간단한 Vault CLI",
     no_args_is_help=True,
     rich_markup_mode="rich",
+    cls=LazyTyperGroup,
 )
-console = Console()
 
-_yaml = YAML()
-_yaml.preserve_quotes = True
-_yaml.indent(mapping=2, sequence=4, offset=2)
 
-# Admin sub-command
-app.add_typer(admin_app, name="admin", help="Administrator commands / 관리자 명령어")
+@functools.cache
+def console() -> "Console":
+    """Shared console, created on first output / 첫 출력 시 생성되는 공용 콘솔."""
+    from rich.console import Console
 
-# Compose sub-command
-app.add_typer(compose_app, name="compose", help="Docker Compose integration / Docker Compose 통합")
+    return Console()
 
-# Extended commands (user-facing)
-app.command("run")(extended.run_command)
-app.command("sh")(extended.shell_export)
-app.command("scan")(extended.scan_secrets)
-app.command("redact")(extended.redact_secrets)
-app.command("watch")(extended.watch_and_restart)
 
-# Self-update / version commands
-app.command("version")(selfupdate.version_command)
-app.command("self-update")(selfupdate.self_update_command)
+def _die(message: str) -> typer.Exit:
+    """Print an error line and return the exit to raise / 오류 출력 후 종료 예외 반환."""
+    console().print(f"[red]✗[/red] {message}")
+    return typer.Exit(1)
 
 
-def _get_authenticated_client() -> VaultClient:
-    """Get authenticated Vault client."""
-    client = VaultClient()
-    
-    if settings.token_cache_file.exists():
-        try:
-            token = settings.token_cache_file.read_text().strip()
-            if token:
-                client = VaultClient(token=token)
-                if client.is_authenticated():
-                    return client
-        except PermissionError:
-            pass
-    
-    if settings.vault_token:
-        client = VaultClient(token=settings.vault_token)
-        if client.is_authenticated():
-            return client
-    
-    if settings.has_approle_credentials():
-        try:
-            result = client.approle_login(
-                settings.approle_role_id,
-                settings.approle_secret_id,
-                settings.approle_mount,
-            )
-            token = result.get("auth", {}).get("client_token")
-            if token:
-                try:
-                    settings.ensure_dirs()
-                    settings.token_cache_file.write_text(token)
-                    settings.token_cache_file.chmod(0o600)
-                except PermissionError:
-                    pass
-                return VaultClient(token=token)
-        except VaultError:
-            pass
-    
-    console.print("[red]✗[/red] Authentication required.")
-    console.print("  Run: vaultctl init")
-    raise typer.Exit(1)
+@functools.lru_cache(maxsize=1)
+def _get_yaml() -> "YAML":
+    """Round-trip YAML handler for compose files, built on first use."""
+    from ruamel.yaml import YAML
+
+    yaml = YAML()
+    yaml.preserve_quotes = True
+    yaml.indent(mapping=2, sequence=4, offset=2)
+    return yaml
+
+
+# Compose file names, checked in this order
+_COMPOSE_FILE_NAMES = ("docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml")
 
 
 def _find_compose_file() -> Optional[Path]:
     """Find docker-compose.yml in current directory."""
-    for name in ["docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml"]:
-        path = Path(name)
-        if path.exists():
-            return path
+    # One directory read instead of a stat() per candidate name
+    try:
+        with os.scandir(".") as entries:
+            names = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        # e.g. a directory that can be entered but not listed
+        return None
+    for name in _COMPOSE_FILE_NAMES:
+        if name in names:
+            return Path(name)
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _hostname() -> str:
+    """This machine's hostname, looked up once."""
+    import socket
+
+    return socket.gethostname()
+
+
+def _replace_compose_file(path: Path, data: Any) -> None:
+    """Write compose data to a temp file and rename it over path.
+    
+    Symlinks are followed so the link stays a link, and the original mode
+    and owner are carried over. If that is not possible (read-only directory,
+    owner that cannot be reassigned) the file is rewritten in place instead.
+    """
+    import stat
+    import tempfile
+
+    target = path.resolve()
+    tmp_path = None
+
+    def discard_tmp() -> None:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+
+    try:
+        st = os.stat(target)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+        with os.fdopen(fd, "w") as f:
+            os.fchown(fd, st.st_uid, st.st_gid)
+            os.fchmod(fd, stat.S_IMODE(st.st_mode))
+            _get_yaml().dump(data, f)
+        os.replace(tmp_path, target)
+        return
+    except PermissionError:
+        discard_tmp()
+    except BaseException:
+        discard_tmp()
+        raise
+    
+    with open(target, "w") as f:
+        _get_yaml().dump(data, f)
+
+
 def _find_env_file() -> Optional[Path]:
     """Find .env file in current directory."""
-    path = Path(".env")
-    return path if path.exists() else None
+    return Path(".env") if os.path.isfile(".env") else None
 
 
 @app.callback(invoke_without_command=True)
@@ -154,13 +231,66 @@ def main(
         vaultctl admin setup vault # Initial Vault setup
     """
     if version:
-        console.print(f"vaultctl {__version__}")
+        from vaultctl import __version__
+
+        console().print(f"vaultctl {__version__}")
         raise typer.Exit(0)
 
 
+_SETUP_BANNER = (
+    "[bold blue]vaultctl Initial Setup[/bold blue]\n\n"
+    "Connect to Vault and configure this environment."
+)
+
+# Answers `init` accepts without prompting (stdin JSON keys / VAULTCTL_INIT_<KEY>)
+_INIT_ANSWER_KEYS = (
+    "vault_addr",
+    "admin_token",
+    "kv_mount",
+    "kv_path",
+    "role_name",
+    "secret_name",
+    "merge_env",
+    "create_empty",
+    "configure_compose",
+)
+
+
+def _load_init_answers() -> dict[str, str]:
+    """Collect preset init answers / 미리 지정된 init 응답 수집.
+    
+    A JSON object piped on stdin is read first; VAULTCTL_INIT_* environment
+    variables take precedence over it.
+    """
+    answers: dict[str, str] = {}
+    
+    if not sys.stdin.isatty():
+        raw = sys.stdin.read().strip()
+        if raw:
+            import json
+
+            try:
+                data = json.loads(raw)
+            except ValueError as e:
+                raise _die(f"Invalid JSON on stdin: {e}")
+            if not isinstance(data, dict):
+                raise _die("Expected a JSON object on stdin.")
+            answers.update(
+                (key, str(value)) for key, value in data.items()
+                if key in _INIT_ANSWER_KEYS and value is not None
+            )
+    
+    for key in _INIT_ANSWER_KEYS:
+        value = os.environ.get(f"VAULTCTL_INIT_{key.upper()}")
+        if value:
+            answers[key] = value
+    
+    return answers
+
+
 @app.command("init")
 def init_command(
-    role_name: str = typer.Option("vaultctl", "--role", "-r", help="AppRole name"),
+    role_name: Optional[str] = typer.Option(None, "--role", "-r", help="AppRole name [default: vaultctl]"),
     secret_name: Optional[str] = typer.Option(None, "--name", "-n", help="Secret name to create/use"),
 ):
     """Initialize vaultctl (one-time setup).
@@ -170,12 +300,47 @@ def init_command(
     2. Generate AppRole credentials for this machine
     3. If .env exists: upload to Vault and create .env.secrets
     4. If docker-compose.yml exists: optionally configure it
+    
+    Without a TTY, answers come from a JSON object on stdin and/or
+    VAULTCTL_INIT_* variables; anything not given uses its default.
+    Options passed on the command line override both.
     """
-    console.print(Panel.fit(
-        "[bold blue]vaultctl Initial Setup[/bold blue]\n\n"
-        "Connect to Vault and configure this environment.",
-        title="🔐 Setup",
-    ))
+    import shutil
+
+    from rich.panel import Panel
+    from rich.prompt import Confirm, Prompt
+
+    from vaultctl.config import settings, write_private_file
+    from vaultctl.utils import ENV_KEY_TRANS, load_env_file, write_env_file
+    from vaultctl.vault_client import VaultClient, VaultError
+
+    answers = _load_init_answers()
+    # Explicit command-line options win over preset answers
+    answers.update(
+        (key, value) for key, value in (("role_name", role_name), ("secret_name", secret_name))
+        if value
+    )
+    interactive = sys.stdin.isatty()
+    
+    def ask(key: str, prompt: str, default: Optional[str] = None, password: bool = False) -> Optional[str]:
+        if key in answers:
+            return answers[key]
+        if not interactive:
+            return default
+        if password:
+            import getpass
+
+            return getpass.getpass(f"{prompt}: ") or default
+        return Prompt.ask(prompt, default=default, console=console())
+    
+    def confirm(key: str, prompt: str, default: bool) -> bool:
+        if key in answers:
+            return answers[key].lower() in ("1", "true", "yes", "y")
+        if not interactive:
+            return default
+        return Confirm.ask(prompt, default=default, console=console())
+
+    console().print(Panel.fit(_SETUP_BANNER, title="🔐 Setup"))
     
     # ─────────────────────────────────────────────────────────────────────────
     # Step 1: Vault Connection
@@ -183,169 +348,171 @@ def init_command(
     current_addr = settings.vault_addr
     has_valid_addr = current_addr and current_addr != "https://vault.example.com"
     
-    vault_addr = Prompt.ask(
+    vault_addr = ask(
+        "vault_addr",
         "Vault server address",
         default=current_addr if has_valid_addr else None,
     )
     
     if not vault_addr:
-        console.print("[red]✗[/red] Vault address is required.")
-        raise typer.Exit(1)
+        raise _die("Vault address is required.")
     
-    console.print(f"\n[dim]Connecting to {vault_addr}...[/dim]")
+    console().print(f"\n[dim]Connecting to {vault_addr}...[/dim]")
     client = VaultClient(addr=vault_addr)
     health = client.health()
     
     if not health.get("initialized") or health.get("sealed"):
-        console.print("[red]✗[/red] Cannot connect to Vault server.")
-        raise typer.Exit(1)
+        raise _die("Cannot connect to Vault server.")
     
-    console.print("[green]✓[/green] Connection successful")
+    console().print("[green]✓[/green] Connection successful")
     
     # ─────────────────────────────────────────────────────────────────────────
     # Step 2: Admin Authentication
     # ─────────────────────────────────────────────────────────────────────────
-    console.print("\n[bold]Admin Authentication[/bold]")
-    console.print("[dim]Admin token is required to generate credentials.[/dim]")
-    admin_token = Prompt.ask("Admin/Root token", password=True)
+    console().print(
+        "\n[bold]Admin Authentication[/bold]\n"
+        "[dim]Admin token is required to generate credentials.[/dim]"
+    )
+    admin_token = ask("admin_token", "Admin/Root token", password=True)
     
     if not admin_token:
-        console.print("[red]✗[/red] Admin token is required.")
-        raise typer.Exit(1)
+        raise _die("Admin token is required.")
     
-    admin_client = VaultClient(addr=vault_addr, token=admin_token)
+    # One client for every step; only its token changes
+    client.set_token(admin_token)
     try:
-        admin_client.token_lookup()
-        console.print("[green]✓[/green] Admin authentication successful")
+        client.token_lookup()
+        console().print("[green]✓[/green] Admin authentication successful")
     except VaultError as e:
-        console.print(f"[red]✗[/red] Admin authentication failed: {e.message}")
-        raise typer.Exit(1)
+        raise _die(f"Admin authentication failed: {e.message}")
     
     # ─────────────────────────────────────────────────────────────────────────
     # Step 3: KV Path Settings
     # ─────────────────────────────────────────────────────────────────────────
-    console.print("\n[bold]KV Secret Path[/bold]")
-    kv_mount = Prompt.ask("KV engine mount", default=settings.kv_mount or "kv")
-    kv_path = Prompt.ask("Secret base path", default=settings.kv_path or "proxmox/lxc")
+    console().print("\n[bold]KV Secret Path[/bold]")
+    kv_mount = ask("kv_mount", "KV engine mount", default=settings.kv_mount or "kv")
+    kv_path = ask("kv_path", "Secret base path", default=settings.kv_path or "proxmox/lxc")
     kv_path = kv_path.strip("/")
     
     # ─────────────────────────────────────────────────────────────────────────
     # Step 4: AppRole Setup
     # ─────────────────────────────────────────────────────────────────────────
-    role_name = Prompt.ask("AppRole name", default=role_name)
+    role_name = ask("role_name", "AppRole name", default="vaultctl")
     
-    console.print(f"\n[dim]Checking AppRole '{role_name}'...[/dim]")
+    console().print(f"\n[dim]Checking AppRole '{role_name}'...[/dim]")
     try:
-        admin_client.approle_read_role(role_name)
-        console.print(f"[green]✓[/green] AppRole found: {role_name}")
+        client.approle_read_role(role_name)
+        console().print(f"[green]✓[/green] AppRole found: {role_name}")
     except VaultError:
-        console.print(f"[red]✗[/red] AppRole '{role_name}' not found.")
-        console.print("\n  First run on admin workstation:")
-        console.print("    vaultctl admin setup vault")
+        console().print(
+            f"[red]✗[/red] AppRole '{role_name}' not found.\n"
+            "\n  First run on admin workstation:\n"
+            "    vaultctl admin setup vault"
+        )
         raise typer.Exit(1)
     
     try:
-        role_id = admin_client.approle_get_role_id(role_name)
-        console.print(f"[green]✓[/green] Role ID retrieved")
+        role_id = client.approle_get_role_id(role_name)
+        console().print(f"[green]✓[/green] Role ID retrieved")
     except VaultError as e:
-        console.print(f"[red]✗[/red] Failed to get Role ID: {e.message}")
-        raise typer.Exit(1)
+        raise _die(f"Failed to get Role ID: {e.message}")
     
-    hostname = socket.gethostname()
-    console.print(f"\n[dim]Generating Secret ID for {hostname}...[/dim]")
+    hostname = _hostname()
+    console().print(f"\n[dim]Generating Secret ID for {hostname}...[/dim]")
     
     try:
-        secret_data = admin_client.approle_generate_secret_id(
+        secret_data = client.approle_generate_secret_id(
             role_name=role_name,
             metadata={"generated_by": "vaultctl init", "hostname": hostname},
         )
         secret_id = secret_data.get("secret_id", "")
-        console.print(f"[green]✓[/green] Secret ID generated")
+        console().print(f"[green]✓[/green] Secret ID generated")
     except VaultError as e:
-        console.print(f"[red]✗[/red] Failed to generate Secret ID: {e.message}")
-        raise typer.Exit(1)
+        raise _die(f"Failed to generate Secret ID: {e.message}")
     
     # Test AppRole login
-    console.print("\n[dim]Testing AppRole authentication...[/dim]")
+    console().print("\n[dim]Testing AppRole authentication...[/dim]")
     try:
         result = client.approle_login(role_id, secret_id, settings.approle_mount)
-        token = result.get("auth", {}).get("client_token")
+        auth = result.get("auth") or {}
+        token = auth.get("client_token")
         
         if not token:
-            console.print("[red]✗[/red] Authentication failed: no token received.")
-            raise typer.Exit(1)
+            raise _die("Authentication failed: no token received.")
         
-        console.print("[green]✓[/green] AppRole authentication successful")
+        console().print("[green]✓[/green] AppRole authentication successful")
     except VaultError as e:
-        console.print(f"[red]✗[/red] AppRole authentication failed: {e.message}")
-        raise typer.Exit(1)
+        raise _die(f"AppRole authentication failed: {e.message}")
     
     # ─────────────────────────────────────────────────────────────────────────
     # Step 5: Save Configuration
     # ─────────────────────────────────────────────────────────────────────────
-    console.print("\n[dim]Saving configuration...[/dim]")
+    console().print("\n[dim]Saving configuration...[/dim]")
     try:
         settings.ensure_dirs()
         
         config_file = settings.config_dir / "config"
-        config_file.write_text(f"""# vaultctl configuration
-VAULT_ADDR={vault_addr}
-VAULT_KV_MOUNT={kv_mount}
-VAULT_KV_PATH={kv_path}
-VAULT_ROLE_ID={role_id}
-VAULT_SECRET_ID={secret_id}
-""")
-        config_file.chmod(0o600)
+        config_lines = [
+            "# vaultctl configuration",
+            f"# Generated on {hostname}",
+            f"VAULT_ADDR={vault_addr}",
+            f"VAULT_KV_MOUNT={kv_mount}",
+            f"VAULT_KV_PATH={kv_path}",
+            f"VAULT_ROLE_ID={role_id}",
+            f"VAULT_SECRET_ID={secret_id}",
+        ]
+        write_private_file(config_file, "\n".join(config_lines) + "\n")
         
-        settings.token_cache_file.write_text(token)
-        settings.token_cache_file.chmod(0o600)
+        settings.write_token_cache(token, auth.get("lease_duration", 0))
         
         # Reload settings
         settings.vault_addr = vault_addr
         settings.kv_mount = kv_mount
         settings.kv_path = kv_path
         
-        console.print(f"[green]✓[/green] Configuration saved: {settings.config_dir}/")
+        console().print(f"[green]✓[/green] Configuration saved: {settings.config_dir}/")
     except PermissionError as e:
-        console.print(f"[yellow]![/yellow] Failed to save configuration: {e}")
+        console().print(f"[yellow]![/yellow] Failed to save configuration: {e}")
     
     # ─────────────────────────────────────────────────────────────────────────
     # Step 6: Secret Name & .env Upload
     # ─────────────────────────────────────────────────────────────────────────
-    console.print("\n[bold]Secret Configuration[/bold]")
+    console().print("\n[bold]Secret Configuration[/bold]")
     
     # Check for existing .env file
     env_file = _find_env_file()
     env_data: dict = {}
     
     if env_file:
-        console.print(f"[blue]![/blue] Found .env file in current directory")
         env_data = load_env_file(str(env_file))
-        console.print(f"   Contains {len(env_data)} variables")
+        console().print(
+            "[blue]![/blue] Found .env file in current directory\n"
+            f"   Contains {len(env_data)} variables"
+        )
     
     # Ask for secret name
-    if not secret_name:
-        secret_name = Prompt.ask(
-            "Secret name (e.g., 001, myapp)",
-            default=hostname.split("-")[-1] if "-" in hostname else hostname,
-        )
+    secret_name = ask(
+        "secret_name",
+        "Secret name (e.g., 001, myapp)",
+        default=hostname.split("-")[-1] if "-" in hostname else hostname,
+    )
     
     if not secret_name:
-        console.print("[yellow]![/yellow] Skipping secret creation.")
+        console().print("[yellow]![/yellow] Skipping secret creation.")
     else:
         secret_full_path = f"{kv_path}/{secret_name}"
         
         # Check if secret already exists
-        test_client = VaultClient(addr=vault_addr, token=token)
+        client.set_token(token)
         try:
-            existing_data = test_client.kv_get(kv_mount, secret_full_path)
+            existing_data = client.kv_get(kv_mount, secret_full_path)
             if existing_data:
-                console.print(f"[blue]![/blue] Secret '{secret_name}' already exists ({len(existing_data)} vars)")
+                console().print(f"[blue]![/blue] Secret '{secret_name}' already exists ({len(existing_data)} vars)")
                 if env_data:
-                    if Confirm.ask("Merge .env into existing secret?", default=False):
+                    if confirm("merge_env", "Merge .env into existing secret?", default=False):
                         merged = {**existing_data, **env_data}
-                        test_client.kv_put(kv_mount, secret_full_path, merged)
-                        console.print(f"[green]✓[/green] Merged {len(env_data)} vars into secret")
+                        client.kv_put(kv_mount, secret_full_path, merged)
+                        console().print(f"[green]✓[/green] Merged {len(env_data)} vars into secret")
                         env_data = merged
                     else:
                         env_data = existing_data
@@ -356,15 +523,17 @@ VAULT_SECRET_ID={secret_id}
         except VaultError:
             # Secret doesn't exist, create it
             if env_data:
-                console.print(f"[dim]Creating secret '{secret_name}' from .env...[/dim]")
-                test_client.kv_put(kv_mount, secret_full_path, env_data)
-                console.print(f"[green]✓[/green] Created secret '{secret_name}' ({len(env_data)} vars)")
+                console().print(f"[dim]Creating secret '{secret_name}' from .env...[/dim]")
+                client.kv_put(kv_mount, secret_full_path, env_data)
+                console().print(f"[green]✓[/green] Created secret '{secret_name}' ({len(env_data)} vars)")
             else:
                 # Create empty secret
-                if Confirm.ask(f"Create empty secret '{secret_name}'?", default=True):
-                    test_client.kv_put(kv_mount, secret_full_path, {"_placeholder": "true"})
-                    console.print(f"[green]✓[/green] Created empty secret '{secret_name}'")
-                    console.print("   Add secrets later: vaultctl admin put {secret_name} KEY=value")
+                if confirm("create_empty", f"Create empty secret '{secret_name}'?", default=True):
+                    client.kv_put(kv_mount, secret_full_path, {"_placeholder": "true"})
+                    console().print(
+                        f"[green]✓[/green] Created empty secret '{secret_name}'\n"
+                        f"   Add secrets later: vaultctl admin put {secret_name} KEY=value"
+                    )
         
         # ─────────────────────────────────────────────────────────────────────
         # Step 7: Generate .env.secrets
@@ -373,20 +542,15 @@ VAULT_SECRET_ID={secret_id}
             env_secrets_file = Path(".env.secrets")
             
             # Transform keys to UPPER_CASE
-            transformed = {}
-            for key, value in env_data.items():
-                if key.startswith("_"):
-                    continue  # Skip placeholder
-                new_key = key.replace("-", "_").replace(".", "_").replace(" ", "_").upper()
-                transformed[new_key] = value
+            transformed = {
+                key.translate(ENV_KEY_TRANS).upper(): value
+                for key, value in env_data.items()
+                if not key.startswith("_")  # Skip placeholder
+            }
             
             if transformed:
                 write_env_file(str(env_secrets_file), transformed, header=f"Generated from Vault: {secret_name}")
-                try:
-                    env_secrets_file.chmod(0o600)
-                except OSError:
-                    pass
-                console.print(f"[green]✓[/green] Created .env.secrets ({len(transformed)} vars)")
+                console().print(f"[green]✓[/green] Created .env.secrets ({len(transformed)} vars)")
         
         # ─────────────────────────────────────────────────────────────────────
         # Step 8: Docker Compose Integration
@@ -394,21 +558,22 @@ VAULT_SECRET_ID={secret_id}
         compose_file = _find_compose_file()
         
         if compose_file:
-            console.print(f"\n[blue]![/blue] Found {compose_file}")
+            console().print(f"\n[blue]![/blue] Found {compose_file}")
             
-            if Confirm.ask("Configure docker-compose.yml to use .env.secrets?", default=True):
+            if confirm("configure_compose", "Configure docker-compose.yml to use .env.secrets?", default=True):
                 # Read compose file
                 with open(compose_file) as f:
-                    compose_data = _yaml.load(f)
+                    compose_data = _get_yaml().load(f)
                 
                 services = compose_data.get("services", {})
                 if not services:
-                    console.print("[yellow]![/yellow] No services found in compose file")
+                    console().print("[yellow]![/yellow] No services found in compose file")
                 else:
                     # Backup
-                    backup_file = compose_file.with_suffix(f".yml.bak.{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+                    backup_file = compose_file.with_suffix(f".yml.bak.{time.strftime('%Y%m%d_%H%M%S')}")
+                    # A real copy: the update below may rewrite the file in place
                     shutil.copy(compose_file, backup_file)
-                    console.print(f"[dim]Backup: {backup_file}[/dim]")
+                    console().print(f"[dim]Backup: {backup_file}[/dim]")
                     
                     # Update services
                     updated_count = 0
@@ -423,16 +588,15 @@ VAULT_SECRET_ID={secret_id}
                             updated_count += 1
                     
                     if updated_count > 0:
-                        with open(compose_file, "w") as f:
-                            _yaml.dump(compose_data, f)
-                        console.print(f"[green]✓[/green] Updated {updated_count} services in {compose_file}")
+                        _replace_compose_file(compose_file, compose_data)
+                        console().print(f"[green]✓[/green] Updated {updated_count} services in {compose_file}")
                     else:
-                        console.print("[dim]All services already configured[/dim]")
+                        console().print("[dim]All services already configured[/dim]")
     
     # ─────────────────────────────────────────────────────────────────────────
     # Done!
     # ─────────────────────────────────────────────────────────────────────────
-    console.print("\n")
+    console().print("\n")
     
     usage_lines = [
         f"[bold green]Setup Complete![/bold green]\n",
@@ -452,7 +616,7 @@ VAULT_SECRET_ID={secret_id}
         usage_lines.append("  vaultctl env <name>    # Generate .env.secrets")
         usage_lines.append("  vaultctl status        # Check status")
     
-    console.print(Panel.fit("\n".join(usage_lines), title="✓ Complete"))
+    console().print(Panel.fit("\n".join(usage_lines), title="✓ Complete"))
 
 
 @app.command("env")
@@ -464,102 +628,160 @@ def env_command(
     no_transform: bool = typer.Option(False, "--no-transform", "-n", help="Keep original key names"),
 ):
     """Generate .env file from Vault."""
-    client = _get_authenticated_client()
+    from vaultctl.auth import with_client
+    from vaultctl.config import settings
+    from vaultctl.utils import ENV_KEY_TRANS, write_env_file
+    from vaultctl.vault_client import VaultError
+
+    kv_mount = settings.kv_mount
     secret_path = settings.get_secret_path(name)
     
     try:
-        data = client.kv_get(settings.kv_mount, secret_path)
+        data = with_client(lambda client: client.kv_get(kv_mount, secret_path))
     except VaultError as e:
         if e.status_code == 404:
-            console.print(f"[red]✗[/red] Secret not found: {name}")
-        else:
-            console.print(f"[red]✗[/red] Failed to retrieve: {e.message}")
-        raise typer.Exit(1)
+            raise _die(f"Secret not found: {name} ({kv_mount}/{secret_path})")
+        raise _die(f"Failed to retrieve: {e.message}")
 
     if not data:
-        console.print(f"[yellow]![/yellow] Secret is empty: {name}")
+        console().print(f"[yellow]![/yellow] Secret is empty: {name}")
         raise typer.Exit(1)
 
     if no_transform:
         transformed_data = data
     else:
-        transformed_data = {}
-        for key, value in data.items():
-            if key.startswith("_"):
-                continue  # Skip placeholders
-            new_key = key.replace("-", "_").replace(".", "_").replace(" ", "_")
-            new_key = new_key.lower() if lowercase else new_key.upper()
-            transformed_data[new_key] = value
+        case = str.lower if lowercase else str.upper
+        transformed_data = {
+            case(key.translate(ENV_KEY_TRANS)): value
+            for key, value in data.items()
+            if not key.startswith("_")  # Skip placeholders
+        }
 
     if stdout:
-        for key, value in sorted(transformed_data.items()):
-            console.print(f"{key}={value}")
+        # Raw KEY=value lines, unquoted; values must not go through Rich
+        # markup or line wrapping
+        sys.stdout.write("".join(f"{key}={transformed_data[key]}\n" for key in sorted(transformed_data)))
     else:
         write_env_file(str(output), transformed_data, header=f"Generated from Vault: {name}")
-        console.print(f"[green]✓[/green] {output} ({len(transformed_data)} variables)")
+        console().print(f"[green]✓[/green] {output} ({len(transformed_data)} variables)")
 
 
 @app.command("status")
 def status_command():
     """Show connection and auth status."""
-    console.print("[bold]vaultctl Status[/bold]\n")
-    
-    console.print("1. Configuration")
-    console.print(f"   Vault: {settings.vault_addr}")
-    console.print(f"   KV: {settings.kv_mount}/{settings.kv_path}/")
-    
-    console.print("\n2. Connection")
-    client = VaultClient()
-    health = client.health()
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from vaultctl.auth import authenticate, reauthenticate, token_rejected
+    from vaultctl.config import settings
+    from vaultctl.utils import format_duration
+    from vaultctl.vault_client import VaultError, get_client
+
+    kv_mount = settings.kv_mount
+    kv_path = settings.kv_path
+
+    # One print per section rather than per line
+    console().print(
+        "[bold]vaultctl Status[/bold]\n\n"
+        "1. Configuration\n"
+        f"   Vault: {settings.vault_addr}\n"
+        f"   KV: {kv_mount}/{kv_path}/"
+    )
     
-    if health.get("initialized") and not health.get("sealed"):
-        console.print("   [green]✓[/green] Vault server connected")
-    else:
-        console.print("   [red]✗[/red] Vault server connection failed")
+    def lookup_and_list(client: "VaultClient") -> tuple[dict, Future]:
+        # Token lookup and secret listing are independent round-trips
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            listing = pool.submit(client.kv_count, kv_mount, kv_path)
+            return client.token_lookup(), listing
+
+    # A successful token lookup proves the server is reachable, so the
+    # health endpoint is only queried to explain a failure
+    token_info = None
+    auth_error = "Authentication required"
+    client = authenticate()
+    if client is not None:
+        try:
+            token_info, listing = lookup_and_list(client)
+        except VaultError as e:
+            if not token_rejected(client, e):
+                auth_error = e.message
+            else:
+                # Retry quietly: with_client() would print its own
+                # "Authentication required" on top of section 3 below
+                client = reauthenticate()
+                if client is not None:
+                    try:
+                        token_info, listing = lookup_and_list(client)
+                    except VaultError as e:
+                        auth_error = e.message
+    
+    if token_info is None:
+        # Same pooled connection the authentication attempt already opened
+        health = get_client().health()
+        if not (health.get("initialized") and not health.get("sealed")):
+            console().print("\n2. Connection\n   [red]✗[/red] Vault server connection failed")
+            raise typer.Exit(1)
+        console().print(
+            "\n2. Connection\n   [green]✓[/green] Vault server connected\n\n"
+            f"3. Authentication\n   [red]✗[/red] {auth_error}\n"
+            "   Run: vaultctl init"
+        )
         raise typer.Exit(1)
     
-    console.print("\n3. Authentication")
-    try:
-        client = _get_authenticated_client()
-        token_info = client.token_lookup()
-        data = token_info.get("data", {})
-        
-        console.print("   [green]✓[/green] Authenticated")
-        ttl = data.get("ttl", 0)
-        console.print(f"   TTL: {format_duration(ttl) if ttl else '[green]unlimited[/green]'}")
-    except typer.Exit:
-        console.print("   [red]✗[/red] Authentication required")
-        raise
+    ttl = token_info.get("data", {}).get("ttl", 0)
+    console().print(
+        "\n2. Connection\n   [green]✓[/green] Vault server connected\n\n"
+        "3. Authentication\n   [green]✓[/green] Authenticated\n"
+        f"   TTL: {format_duration(ttl) if ttl else '[green]unlimited[/green]'}"
+    )
     
-    console.print("\n4. Secrets Access")
     try:
-        items = client.kv_list(settings.kv_mount, settings.kv_path)
-        console.print(f"   [green]✓[/green] {len(items) if items else 0} secrets accessible")
+        access = f"   [green]✓[/green] {listing.result()} secrets accessible"
     except VaultError as e:
-        console.print(f"   [yellow]![/yellow] {e.message}")
-    
-    console.print("\n[green]✓[/green] All checks passed")
+        access = f"   [yellow]![/yellow] {e.message}"
+    console().print(f"\n4. Secrets Access\n{access}\n\n[green]✓[/green] All checks passed")
+
+
+# (label, key, getter) rows shown by `vaultctl config`
+_CONFIG_ROWS = (
+    ("Vault Address", "vault_addr", lambda s: s.vault_addr),
+    ("KV Mount", "kv_mount", lambda s: s.kv_mount),
+    ("KV Path", "kv_path", lambda s: s.kv_path),
+    ("Full Path", "full_path", lambda s: f"{s.kv_mount}/data/{s.kv_path}/<n>"),
+    ("Config Directory", "config_dir", lambda s: s.config_dir),
+)
+_CONFIG_COLUMNS = (("Setting", "green"), ("Value", "white"))
 
 
 @app.command("config")
-def config_command():
+def config_command(
+    plain: bool = typer.Option(False, "--plain", help="Print key=value lines (for scripts)"),
+    as_json: bool = typer.Option(False, "--json", help="Print a JSON object (for scripts)"),
+):
     """Show current configuration."""
+    from vaultctl.config import settings
+
+    if as_json:
+        import json
+
+        values = {key: getter(settings) for _, key, getter in _CONFIG_ROWS}
+        data = {key: str(value) if value else None for key, value in values.items()}
+        sys.stdout.write(json.dumps(data, indent=2) + "\n")
+        return
+    if plain:
+        sys.stdout.writelines(f"{key}={getter(settings) or ''}\n" for _, key, getter in _CONFIG_ROWS)
+        return
+
+    from rich.table import Table
+
     table = Table(title="Current Configuration", show_header=True, header_style="bold cyan")
-    table.add_column("Setting", style="green")
-    table.add_column("Value", style="white")
-
-    configs = [
-        ("Vault Address", settings.vault_addr),
-        ("KV Mount", settings.kv_mount),
-        ("KV Path", settings.kv_path),
-        ("Full Path", f"{settings.kv_mount}/data/{settings.kv_path}/<n>"),
-        ("Config Directory", str(settings.config_dir)),
-    ]
+    for header, style in _CONFIG_COLUMNS:
+        table.add_column(header, style=style)
 
-    for name, value in configs:
-        table.add_row(name, str(value) if value else "-")
+    for label, _, getter in _CONFIG_ROWS:
+        value = getter(settings)
+        table.add_row(label, str(value) if value else "-")
 
-    console.print(table)
+    console().print(table)
 
 
 if __name__ == "__main__":
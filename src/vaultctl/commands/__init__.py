@@ -17,14 +17,26 @@ Structure:
     │   ├── compose.py       # Docker Compose integration
     │   └── extended.py      # run, sh, scan, redact, watch
     ├── setup.py             # User setup commands (init, systemd, etc.)
+    ├── selfupdate.py        # version, self-update
     ├── compose.py           # Legacy - redirects to user/compose.py
     ├── extended.py          # Legacy - redirects to user/extended.py
     └── repo.py              # Legacy - redirects to admin/repo.py
+
+Submodules are intentionally not imported here: pulling in every command
+module on package import taxes each CLI invocation (even ``--version``).
+The names re-exported below are resolved on first access instead (PEP 562).
+PyInstaller picks them up through ``hiddenimports`` in vaultctl.spec.
 """
 
-from vaultctl.commands.admin import app as admin_app
-from vaultctl.commands.user import compose, extended
-from vaultctl.commands import setup
+import importlib
+
+# Public name -> (module, attribute or None for the module itself)
+_EXPORTS = {
+    "admin_app": ("vaultctl.commands.admin", "app"),
+    "compose": ("vaultctl.commands.user.compose", None),
+    "extended": ("vaultctl.commands.user.extended", None),
+    "setup": ("vaultctl.commands.setup", None),
+}
 
 __all__ = [
     "admin_app",
@@ -32,3 +44,14 @@ __all__ = [
     "extended",
     "setup",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve a re-exported name on first access / 첫 접근 시 재노출 이름 해석."""
+    if name in _EXPORTS:
+        module_path, attr = _EXPORTS[name]
+        module = importlib.import_module(module_path)
+        value = module if attr is None else getattr(module, attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
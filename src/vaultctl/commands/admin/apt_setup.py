@@ -12,7 +12,8 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
-from rich.table import Table
+
+from vaultctl.config import write_private_file
 
 console = Console()
 
@@ -66,8 +67,7 @@ AUTH_PASS={config.get('AUTH_PASS', '')}
 WEB_SERVER={config.get('WEB_SERVER', '')}
 LISTEN_PORT={config.get('LISTEN_PORT', '8080')}
 """
-    APT_CONFIG_FILE.write_text(content)
-    APT_CONFIG_FILE.chmod(0o600)
+    write_private_file(APT_CONFIG_FILE, content)
 
 
 def _get_gpg_key_id() -> Optional[str]:
@@ -211,12 +211,11 @@ def _setup_apt_auth(config: dict) -> None:
     ], check=True, capture_output=True)
     htpasswd_file.chmod(0o600)
     
-    credentials_file.write_text(f"""# APT Repository Credentials
+    write_private_file(credentials_file, f"""# APT Repository Credentials
 USER={config['AUTH_USER']}
 PASS={config['AUTH_PASS']}
 URL=https://{config['DOMAIN']}
 """)
-    credentials_file.chmod(0o600)
     
     console.print("[green]✓[/green] Authentication configured")
     console.print(f"\n[yellow]┌─────────────────────────────────────────────────┐[/yellow]")
@@ -667,8 +666,7 @@ def apt_client_setup(
         auth_dir = Path("/etc/apt/auth.conf.d")
         auth_dir.mkdir(parents=True, exist_ok=True)
         auth_file = auth_dir / "internal.conf"
-        auth_file.write_text(f"machine {domain}\nlogin {user}\npassword {password}\n")
-        auth_file.chmod(0o600)
+        write_private_file(auth_file, f"machine {domain}\nlogin {user}\npassword {password}\n")
         console.print("      [green]✓[/green] Done")
     else:
         console.print("[2/4] Skipping authentication (public repo)")
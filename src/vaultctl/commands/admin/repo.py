@@ -17,9 +17,10 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
 from rich.table import Table
 
+from vaultctl.config import write_private_file
+
 app = typer.Typer(help="APT repository management / APT 저장소 관리")
 console = Console()
 
@@ -55,7 +56,7 @@ def _load_config() -> dict:
 def _save_config(config: dict) -> None:
     """Save APT config."""
     lines = [f'{key}="{value}"' for key, value in config.items()]
-    APT_CONFIG_FILE.write_text("\n".join(lines) + "\n")
+    write_private_file(APT_CONFIG_FILE, "\n".join(lines) + "\n")
 
 
 def _check_gh_installed() -> bool:
@@ -18,59 +18,20 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from vaultctl.auth import get_authenticated_client, with_client
 from vaultctl.config import settings
 from vaultctl.utils import copy_to_clipboard, create_kv_table, parse_key_value_args
-from vaultctl.vault_client import VaultClient, VaultError
+from vaultctl.vault_client import VaultError
 
 console = Console()
 
 
-def _get_authenticated_client() -> VaultClient:
-    """Get authenticated Vault client."""
-    client = VaultClient()
-    
-    if settings.token_cache_file.exists():
-        try:
-            token = settings.token_cache_file.read_text().strip()
-            if token:
-                client = VaultClient(token=token)
-                if client.is_authenticated():
-                    return client
-        except PermissionError:
-            pass
-    
-    if settings.vault_token:
-        client = VaultClient(token=settings.vault_token)
-        if client.is_authenticated():
-            return client
-    
-    if settings.has_approle_credentials():
-        try:
-            result = client.approle_login(
-                settings.approle_role_id,
-                settings.approle_secret_id,
-                settings.approle_mount,
-            )
-            token = result.get("auth", {}).get("client_token")
-            if token:
-                client = VaultClient(token=token)
-                return client
-        except VaultError:
-            pass
-    
-    console.print("[red]✗[/red] Authentication required.")
-    console.print("  Run: vaultctl init")
-    raise typer.Exit(1)
-
-
 def list_secrets(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed info"),
 ):
     """List all secrets / 시크릿 목록 조회."""
-    client = _get_authenticated_client()
-    
     try:
-        items = client.kv_list(settings.kv_mount, settings.kv_path)
+        items = with_client(lambda client: client.kv_list(settings.kv_mount, settings.kv_path))
     except VaultError as e:
         console.print(f"[red]✗[/red] Failed to list: {e.message}")
         console.print(f"  Path: {settings.kv_mount}/{settings.kv_path}/")
@@ -92,7 +53,7 @@ def list_secrets(
             name = item.rstrip("/")
             try:
                 secret_path = settings.get_secret_path(name)
-                data = client.kv_get(settings.kv_mount, secret_path)
+                data = with_client(lambda client: client.kv_get(settings.kv_mount, secret_path))
                 keys = ", ".join(sorted(data.keys()))
                 if len(keys) > 50:
                     keys = keys[:50] + "..."
@@ -115,11 +76,10 @@ def get_secret(
     raw: bool = typer.Option(False, "--raw", help="JSON output"),
 ):
     """Get secret / 시크릿 조회."""
-    client = _get_authenticated_client()
     secret_path = settings.get_secret_path(name)
     
     try:
-        data = client.kv_get(settings.kv_mount, secret_path)
+        data = with_client(lambda client: client.kv_get(settings.kv_mount, secret_path))
     except VaultError as e:
         if e.status_code == 404:
             console.print(f"[red]✗[/red] Secret not found: {name}")
@@ -165,7 +125,6 @@ def put_secret(
     merge: bool = typer.Option(True, "--merge/--replace", help="Merge with existing (default)"),
 ):
     """Store secret / 시크릿 저장."""
-    client = _get_authenticated_client()
     secret_path = settings.get_secret_path(name)
     
     new_data = parse_key_value_args(data)
@@ -176,14 +135,14 @@ def put_secret(
 
     if merge:
         try:
-            existing = client.kv_get(settings.kv_mount, secret_path)
+            existing = with_client(lambda client: client.kv_get(settings.kv_mount, secret_path))
             existing.update(new_data)
             new_data = existing
         except VaultError:
             pass
 
     try:
-        client.kv_put(settings.kv_mount, secret_path, new_data)
+        with_client(lambda client: client.kv_put(settings.kv_mount, secret_path, new_data))
         console.print(f"[green]✓[/green] Saved: {name}")
         console.print(f"[dim]Path: {settings.kv_mount}/{secret_path}[/dim]")
 
@@ -200,7 +159,8 @@ def delete_secret(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ):
     """Delete secret / 시크릿 삭제."""
-    client = _get_authenticated_client()
+    # Fail on missing credentials before asking for confirmation
+    get_authenticated_client()
     secret_path = settings.get_secret_path(name)
     
     if not force:
@@ -210,7 +170,7 @@ def delete_secret(
             raise typer.Exit(0)
 
     try:
-        client.kv_delete(settings.kv_mount, secret_path)
+        with_client(lambda client: client.kv_delete(settings.kv_mount, secret_path))
         console.print(f"[green]✓[/green] Deleted: {name}")
     except VaultError as e:
         console.print(f"[red]✗[/red] Failed to delete: {e.message}")
@@ -222,7 +182,7 @@ def import_secrets(
     dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Validate only, no save"),
 ):
     """Import secrets from JSON file / JSON 파일에서 시크릿 일괄 등록."""
-    client = _get_authenticated_client()
+    get_authenticated_client()
     
     if not file.exists():
         console.print(f"[red]✗[/red] File not found: {file}")
@@ -260,7 +220,7 @@ def import_secrets(
         else:
             try:
                 secret_path = settings.get_secret_path(name)
-                client.kv_put(settings.kv_mount, secret_path, secret_data)
+                with_client(lambda client: client.kv_put(settings.kv_mount, secret_path, secret_data))
                 console.print(f"  [green]✓[/green] {name}")
                 success += 1
             except VaultError as e:
@@ -274,10 +234,8 @@ def export_secrets(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file (stdout if omitted)"),
 ):
     """Export all secrets to JSON / 모든 시크릿을 JSON으로 내보내기."""
-    client = _get_authenticated_client()
-    
     try:
-        items = client.kv_list(settings.kv_mount, settings.kv_path)
+        items = with_client(lambda client: client.kv_list(settings.kv_mount, settings.kv_path))
     except VaultError as e:
         console.print(f"[red]✗[/red] Failed to list: {e.message}")
         raise typer.Exit(1)
@@ -291,7 +249,7 @@ def export_secrets(
         name = item.rstrip("/")
         try:
             secret_path = settings.get_secret_path(name)
-            data = client.kv_get(settings.kv_mount, secret_path)
+            data = with_client(lambda client: client.kv_get(settings.kv_mount, secret_path))
             result[name] = data
         except VaultError:
             result[name] = {}
@@ -11,59 +11,20 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from vaultctl.auth import get_authenticated_client, with_client
 from vaultctl.config import settings
 from vaultctl.utils import format_duration
-from vaultctl.vault_client import VaultClient, VaultError
+from vaultctl.vault_client import VaultError
 
 app = typer.Typer(help="Token management / 토큰 관리")
 console = Console()
 
 
-def _get_authenticated_client() -> VaultClient:
-    """Get authenticated Vault client."""
-    client = VaultClient()
-    
-    if settings.token_cache_file.exists():
-        try:
-            token = settings.token_cache_file.read_text().strip()
-            if token:
-                client = VaultClient(token=token)
-                if client.is_authenticated():
-                    return client
-        except PermissionError:
-            pass
-    
-    if settings.vault_token:
-        client = VaultClient(token=settings.vault_token)
-        if client.is_authenticated():
-            return client
-    
-    if settings.has_approle_credentials():
-        try:
-            result = client.approle_login(
-                settings.approle_role_id,
-                settings.approle_secret_id,
-                settings.approle_mount,
-            )
-            token = result.get("auth", {}).get("client_token")
-            if token:
-                client = VaultClient(token=token)
-                return client
-        except VaultError:
-            pass
-    
-    console.print("[red]✗[/red] Authentication required.")
-    console.print("  Run: vaultctl init")
-    raise typer.Exit(1)
-
-
 @app.command("status")
 def token_status():
     """Show token status / 토큰 상태 확인."""
-    client = _get_authenticated_client()
-    
     try:
-        token_info = client.token_lookup()
+        token_info = with_client(lambda client: client.token_lookup())
     except VaultError as e:
         console.print(f"[red]✗[/red] {e.message}")
         raise typer.Exit(1)
@@ -101,11 +62,9 @@ def token_status():
 @app.command("renew")
 def token_renew():
     """Renew token / 토큰 갱신."""
-    client = _get_authenticated_client()
-    
     try:
-        result = client.token_renew()
-        auth_data = result.get("auth", {})
+        result = with_client(lambda client: client.token_renew())
+        auth_data = result.get("auth") or {}
         ttl = auth_data.get("lease_duration", 0)
         
         console.print("[green]✓[/green] Token renewed")
@@ -118,16 +77,16 @@ def token_renew():
             if settings.has_approle_credentials():
                 console.print("[dim]Re-authenticating with AppRole...[/dim]")
                 try:
-                    result = client.approle_login(
+                    result = get_authenticated_client().approle_login(
                         settings.approle_role_id,
                         settings.approle_secret_id,
                         settings.approle_mount,
                     )
-                    token = result.get("auth", {}).get("client_token")
+                    auth = result.get("auth") or {}
+                    token = auth.get("client_token")
                     if token:
                         settings.ensure_dirs()
-                        settings.token_cache_file.write_text(token)
-                        settings.token_cache_file.chmod(0o600)
+                        settings.write_token_cache(token, auth.get("lease_duration", 0))
                         console.print("[green]✓[/green] AppRole re-authentication successful")
                 except VaultError as e2:
                     console.print(f"[red]✗[/red] Re-authentication failed: {e2.message}")
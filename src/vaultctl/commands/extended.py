@@ -33,49 +33,14 @@ console = Console()
 
 
 def _get_authenticated_client() -> VaultClient:
-    """Get authenticated Vault client / 인증된 클라이언트 반환."""
-    client = VaultClient()
+    """Get authenticated Vault client / 인증된 클라이언트 반환.
     
-    # Try cached token
-    if settings.token_cache_file.exists():
-        try:
-            token = settings.token_cache_file.read_text().strip()
-            if token:
-                client = VaultClient(token=token)
-                if client.is_authenticated():
-                    return client
-        except PermissionError:
-            pass
-    
-    # Try config token
-    if settings.vault_token:
-        client = VaultClient(token=settings.vault_token)
-        if client.is_authenticated():
-            return client
-    
-    # Try AppRole
-    if settings.has_approle_credentials():
-        try:
-            result = client.approle_login(
-                settings.approle_role_id,
-                settings.approle_secret_id,
-                settings.approle_mount,
-            )
-            token = result.get("auth", {}).get("client_token")
-            if token:
-                try:
-                    settings.ensure_dirs()
-                    settings.token_cache_file.write_text(token)
-                    settings.token_cache_file.chmod(0o600)
-                except PermissionError:
-                    pass
-                return VaultClient(token=token)
-        except VaultError:
-            pass
-    
-    console.print("[red]✗[/red] Authentication required.")
-    console.print("  Run: vaultctl init")
-    raise typer.Exit(1)
+    Delegates to the shared ladder in vaultctl.auth, which understands the
+    JSON token cache written by current versions.
+    """
+    from vaultctl.auth import get_authenticated_client
+
+    return get_authenticated_client()
 
 
 def _get_secrets(name: str) -> dict:
@@ -14,6 +14,19 @@ Usage:
     vaultctl watch <n> -- cmd    # Auto-restart on secret change
 """
 
-from vaultctl.commands.user import compose, extended
+import importlib
 
 __all__ = ["compose", "extended"]
+
+
+def __getattr__(name: str):
+    """Import a command module on first access / 첫 접근 시 명령어 모듈 임포트.
+    
+    ``vaultctl run`` should not pay for compose's YAML handling, so the
+    submodules are not imported with the package.
+    """
+    if name in __all__:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
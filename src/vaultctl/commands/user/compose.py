@@ -1,5 +1,4 @@
 """Docker Compose integration commands for vaultctl."""
-import hashlib
 import shutil
 import subprocess
 from datetime import datetime
@@ -12,11 +11,12 @@ from rich.panel import Panel
 from rich.prompt import Prompt
 from ruamel.yaml import YAML
 
+from vaultctl.auth import with_client
 from vaultctl.config import settings
-from vaultctl.utils import write_env_file
-from vaultctl.vault_client import VaultClient, VaultError
+from vaultctl.utils import ENV_KEY_TRANS, write_env_file
+from vaultctl.vault_client import VaultError
 
-app = typer.Typer(name="compose", help="Docker Compose integration", no_args_is_help=True)
+app = typer.Typer(name="compose", help="Docker Compose integration / Docker Compose 통합", no_args_is_help=True)
 console = Console()
 
 _yaml = YAML()
@@ -24,37 +24,11 @@ _yaml.preserve_quotes = True
 _yaml.indent(mapping=2, sequence=4, offset=2)
 
 
-def _get_authenticated_client() -> VaultClient:
-    client = VaultClient()
-    if settings.token_cache_file.exists():
-        try:
-            token = settings.token_cache_file.read_text().strip()
-            if token:
-                client = VaultClient(token=token)
-                if client.is_authenticated():
-                    return client
-        except PermissionError:
-            pass
-    if settings.vault_token:
-        client = VaultClient(token=settings.vault_token)
-        if client.is_authenticated():
-            return client
-    if settings.has_approle_credentials():
-        try:
-            result = client.approle_login(settings.approle_role_id, settings.approle_secret_id, settings.approle_mount)
-            token = result.get("auth", {}).get("client_token")
-            if token:
-                return VaultClient(token=token)
-        except VaultError:
-            pass
-    console.print("[red]✗[/red] Authentication required. Run: vaultctl init")
-    raise typer.Exit(1)
-
-
 def _get_secrets(name: str) -> dict:
-    client = _get_authenticated_client()
+    mount = settings.kv_mount
+    path = settings.get_secret_path(name)
     try:
-        return client.kv_get(settings.kv_mount, settings.get_secret_path(name))
+        return with_client(lambda client: client.kv_get(mount, path))
     except VaultError:
         return {}
 
@@ -96,12 +70,8 @@ def _sync_secrets(name: str, output_path: Path) -> int:
     if not secrets:
         console.print(f"[red]✗[/red] Secret not found: {name}")
         raise typer.Exit(1)
-    transformed = {k.replace("-", "_").replace(".", "_").upper(): v for k, v in secrets.items()}
+    transformed = {k.translate(ENV_KEY_TRANS).upper(): v for k, v in secrets.items()}
     write_env_file(str(output_path), transformed, header=f"Vault secret: {name}")
-    try:
-        output_path.chmod(0o600)
-    except OSError:
-        pass
     return len(transformed)
 
 
@@ -16,59 +16,35 @@ import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Optional, List
+from typing import List, Optional
 
 import typer
 from rich.console import Console
 
+from vaultctl.auth import with_client
 from vaultctl.config import settings
-from vaultctl.vault_client import VaultClient, VaultError
+from vaultctl.vault_client import VaultError
 
 console = Console()
 
 
-def _get_authenticated_client() -> VaultClient:
-    """Get authenticated Vault client."""
-    client = VaultClient()
-    if settings.token_cache_file.exists():
-        try:
-            token = settings.token_cache_file.read_text().strip()
-            if token:
-                client = VaultClient(token=token)
-                if client.is_authenticated():
-                    return client
-        except PermissionError:
-            pass
-    if settings.vault_token:
-        client = VaultClient(token=settings.vault_token)
-        if client.is_authenticated():
-            return client
-    if settings.has_approle_credentials():
-        try:
-            result = client.approle_login(settings.approle_role_id, settings.approle_secret_id, settings.approle_mount)
-            token = result.get("auth", {}).get("client_token")
-            if token:
-                return VaultClient(token=token)
-        except VaultError:
-            pass
-    console.print("[red]✗[/red] Authentication required. Run: vaultctl init")
-    raise typer.Exit(1)
+def _read_secret(mount: str, path: str) -> dict:
+    """Get secrets at an already resolved KV location."""
+    try:
+        return with_client(lambda client: client.kv_get(mount, path))
+    except VaultError:
+        return {}
 
 
 def _get_secrets(name: str) -> dict:
     """Get secrets."""
-    client = _get_authenticated_client()
-    try:
-        return client.kv_get(settings.kv_mount, settings.get_secret_path(name))
-    except VaultError:
-        return {}
+    return _read_secret(settings.kv_mount, settings.get_secret_path(name))
 
 
 def _list_secrets() -> list[str]:
     """List secrets."""
-    client = _get_authenticated_client()
     try:
-        return [k.rstrip("/") for k in client.kv_list(settings.kv_mount, settings.kv_path)]
+        return [k.rstrip("/") for k in with_client(lambda client: client.kv_list(settings.kv_mount, settings.kv_path))]
     except VaultError:
         return []
 
@@ -113,12 +89,11 @@ def shell_export(
     if not secrets:
         return
     
-    for key, value in secrets.items():
-        escaped = str(value).replace("'", "'\"'\"'")
-        if _format == "fish":
-            print(f"set -gx {key} '{escaped}'")
-        else:
-            print(f"export {key}='{escaped}'")
+    template = "set -gx {} '{}'\n" if _format == "fish" else "export {}='{}'\n"
+    sys.stdout.write("".join(
+        template.format(key, str(value).replace("'", "'\"'\"'"))
+        for key, value in secrets.items()
+    ))
 
 
 def scan_secrets(
@@ -225,18 +200,21 @@ def watch_and_restart(
     on_change: str = typer.Option("restart", "--on-change", help="Action: restart, reload, exec"),
 ):
     """Detect secret changes and auto-restart process."""
-    def get_secrets_hash():
-        data = _get_secrets(name)
+    # Resolve the KV location once; the loop below polls it for its whole lifetime
+    mount = settings.kv_mount
+    path = settings.get_secret_path(name)
+    
+    def secrets_hash(data: dict) -> Optional[str]:
         if not data:
             return None
         return hashlib.sha256(str(sorted(data.items())).encode()).hexdigest()
     
-    current_hash = get_secrets_hash()
+    secrets = _read_secret(mount, path)
+    current_hash = secrets_hash(secrets)
     process: Optional[subprocess.Popen] = None
     
     def start_process():
         nonlocal process
-        secrets = _get_secrets(name) or {}
         env = os.environ.copy()
         env.update(secrets)
         process = subprocess.Popen(command, env=env)
@@ -264,10 +242,12 @@ def watch_and_restart(
     
     while True:
         time.sleep(interval)
-        new_hash = get_secrets_hash()
+        fetched = _read_secret(mount, path)
+        new_hash = secrets_hash(fetched)
         if new_hash != current_hash:
             console.print("[yellow]Secret change detected![/yellow]")
             current_hash = new_hash
+            secrets = fetched
             if on_change == "restart":
                 restart_process()
             elif on_change == "reload" and process:
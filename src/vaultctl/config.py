@@ -7,11 +7,14 @@ Configuration priority (highest to lowest):
 3. System config (/etc/vaultctl/config) - for admin use
 """
 
+import json
 import os
+import tempfile
+import time
 from pathlib import Path
 from typing import Any, Optional, Tuple, Type
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
 
 
@@ -19,9 +22,6 @@ def _load_config_file(filepath: Path) -> dict[str, str]:
     """Load key=value config file / key=value 설정 파일 로드."""
     config = {}
     
-    if not filepath.exists():
-        return config
-    
     try:
         content = filepath.read_text()
         for line in content.splitlines():
@@ -35,7 +35,7 @@ def _load_config_file(filepath: Path) -> dict[str, str]:
             key = key.strip()
             value = value.strip().strip('"').strip("'")
             config[key] = value
-    except PermissionError:
+    except (FileNotFoundError, PermissionError):
         pass
     except Exception:
         pass
@@ -43,6 +43,25 @@ def _load_config_file(filepath: Path) -> dict[str, str]:
     return config
 
 
+def write_private_file(path: Path, content: str) -> None:
+    """Atomically write a file readable only by its owner / 소유자 전용 파일을 원자적으로 저장.
+    
+    The content goes to a 0600 temp file in the same directory which then
+    replaces ``path``, so it is never visible with umask-derived permissions.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 def _get_user_config_path() -> Path:
     """Get user config path / 사용자 설정 파일 경로."""
     config_home = os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")
@@ -167,6 +186,8 @@ class Settings(BaseSettings):
         description="Token renewal threshold in seconds. Renew if TTL is below this.",
     )
 
+    _dirs_ensured: bool = PrivateAttr(default=False)
+
     @property
     def config_dir(self) -> Path:
         """Config directory path (~/.config/vaultctl)."""
@@ -189,11 +210,58 @@ class Settings(BaseSettings):
         """User config file path."""
         return self.config_dir / "config"
 
+    def read_token_cache(self) -> Tuple[Optional[str], Optional[float]]:
+        """Read cached token and its expiry time.
+        
+        The cache holds ``{"token": ..., "expires_at": <unix time>}``; a bare
+        token (older format) is returned with an unknown expiry.
+        
+        Returns:
+            (token, expires_at), either may be None
+        """
+        # A single raw read; the cache is far smaller than one page
+        try:
+            fd = os.open(self.token_cache_file, os.O_RDONLY)
+        except (FileNotFoundError, PermissionError):
+            return None, None
+        try:
+            content = os.read(fd, 4096).decode("utf-8", "ignore").strip()
+        finally:
+            os.close(fd)
+        
+        if not content.startswith("{"):
+            return content or None, None
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return None, None
+        token = data.get("token")
+        expires_at = data.get("expires_at")
+        # Anything else would break the expiry arithmetic in auth.authenticate()
+        if isinstance(expires_at, bool) or not isinstance(expires_at, (int, float)):
+            expires_at = None
+        return (token or None) if isinstance(token, str) else None, expires_at
+
+    def write_token_cache(self, token: str, lease_duration: int = 0) -> None:
+        """Cache a token with its expiry (lease_duration 0 = no expiry)."""
+        expires_at = time.time() + lease_duration if lease_duration > 0 else None
+        write_private_file(self.token_cache_file, json.dumps({"token": token, "expires_at": expires_at}))
+
+    def clear_token_cache(self) -> None:
+        """Remove the cached token (e.g. after Vault rejected it)."""
+        try:
+            self.token_cache_file.unlink(missing_ok=True)
+        except PermissionError:
+            pass
+
     def ensure_dirs(self) -> None:
-        """Create necessary directories."""
+        """Create necessary directories (once per process)."""
+        if self._dirs_ensured:
+            return
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir.chmod(0o700)
+        self._dirs_ensured = True
 
     def has_approle_credentials(self) -> bool:
         """Check if AppRole credentials are available."""
@@ -2,6 +2,7 @@
 
 import os
 import platform
+import stat
 import subprocess
 import sys
 from datetime import datetime, timedelta
@@ -149,6 +150,10 @@ def parse_key_value_args(args: list[str]) -> dict[str, str]:
     return result
 
 
+# Characters that are not valid in env var names, mapped to "_"
+ENV_KEY_TRANS = str.maketrans("-. ", "___")
+
+
 def load_env_file(path: str) -> dict[str, str]:
     """환경변수 파일 로드."""
     result = {}
@@ -170,19 +175,39 @@ def load_env_file(path: str) -> dict[str, str]:
     return result
 
 
+def format_env_lines(data: dict[str, Any]) -> list[str]:
+    """환경변수를 키 순으로 정렬된 KEY=value 줄 목록으로 변환."""
+    lines = []
+    for key in sorted(data):
+        # Ensure value is string
+        value = str(data[key])
+        # 특수문자가 있으면 따옴표로 감싸기
+        if any(c in value for c in [" ", "'", '"', "$", "\n"]):
+            value = f'"{value}"'
+        lines.append(f"{key}={value}\n")
+    return lines
+
+
 def write_env_file(path: str, data: dict[str, str], header: Optional[str] = None) -> None:
-    """환경변수 파일 저장."""
-    with open(path, "w") as f:
-        if header:
-            f.write(f"# {header}\n")
-        f.write(f"# Generated at: {datetime.now().isoformat()}\n\n")
-        for key, value in sorted(data.items()):
-            # Ensure value is string
-            value = str(value)
-            # 특수문자가 있으면 따옴표로 감싸기
-            if any(c in value for c in [" ", "'", '"', "$", "\n"]):
-                value = f'"{value}"'
-            f.write(f"{key}={value}\n")
+    """환경변수 파일 저장 (소유자 전용 0600).
+    
+    The file is written in place, so a symlink, the file's owner and special
+    files such as /dev/stdout are left as they are.
+    """
+    lines = [f"# {header}\n"] if header else []
+    lines.append(f"# Generated at: {datetime.now().isoformat()}\n\n")
+    lines.extend(format_env_lines(data))
+    
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        # O_CREAT's mode only applies to new files; tighten an existing one
+        # before any secret is written to it
+        if stat.S_ISREG(os.fstat(fd).st_mode):
+            try:
+                os.fchmod(fd, 0o600)
+            except PermissionError:
+                pass
+        f.write("".join(lines))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
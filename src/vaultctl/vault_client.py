@@ -4,12 +4,9 @@ import json
 from typing import Any, Optional
 
 import httpx
-from rich.console import Console
 
 from vaultctl.config import settings
 
-console = Console()
-
 
 class VaultError(Exception):
     """Vault API 오류."""
@@ -88,6 +85,15 @@ class VaultClient:
         except httpx.RequestError as e:
             raise VaultError(f"연결 실패: {e}") from e
 
+    def set_token(self, token: Optional[str]) -> None:
+        """토큰 교체 (기존 HTTP 연결 풀 유지)."""
+        self.token = token
+        if self._client is not None:
+            if token:
+                self._client.headers["X-Vault-Token"] = token
+            else:
+                self._client.headers.pop("X-Vault-Token", None)
+
     def close(self) -> None:
         """클라이언트 종료."""
         if self._client is not None:
@@ -143,14 +149,16 @@ class VaultClient:
         Returns:
             인증 응답 (client_token 포함)
         """
-        # AppRole 로그인은 토큰 없이 요청
+        # AppRole 로그인은 토큰 없이 요청 (연결 풀은 공유)
+        http_client = self.client
+        request = http_client.build_request(
+            "POST",
+            f"/v1/auth/{mount}/login",
+            json={"role_id": role_id, "secret_id": secret_id},
+        )
+        request.headers.pop("X-Vault-Token", None)
         try:
-            response = httpx.post(
-                f"{self.addr}/v1/auth/{mount}/login",
-                json={"role_id": role_id, "secret_id": secret_id},
-                verify=not settings.vault_skip_verify,
-                timeout=30.0,
-            )
+            response = http_client.send(request)
 
             if response.status_code >= 400:
                 result = response.json() if response.content else {}
@@ -264,6 +272,10 @@ class VaultClient:
                 return []
             raise
 
+    def kv_count(self, mount: str, path: str = "") -> int:
+        """KV v2 경로의 항목 수 조회."""
+        return len(self.kv_list(mount, path))
+
     def kv_metadata(self, mount: str, path: str) -> dict[str, Any]:
         """KV v2 메타데이터 조회."""
         result = self._request("GET", f"{mount}/metadata/{path}")
@@ -0,0 +1,20 @@
+"""Shared fixtures."""
+
+import pytest
+
+from vaultctl.auth import authenticate
+from vaultctl.config import settings
+
+
+@pytest.fixture(autouse=True)
+def isolated_settings(tmp_path, monkeypatch):
+    """Point config/cache at tmp_path and drop credentials from the environment."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(settings, "_dirs_ensured", False)
+    monkeypatch.setattr(settings, "vault_token", None)
+    monkeypatch.setattr(settings, "approle_role_id", None)
+    monkeypatch.setattr(settings, "approle_secret_id", None)
+    authenticate.cache_clear()
+    yield settings
+    authenticate.cache_clear()
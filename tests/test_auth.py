@@ -0,0 +1,88 @@
+"""Tests for the shared authentication ladder."""
+
+import pytest
+
+from vaultctl import auth
+from vaultctl.config import settings
+from vaultctl.vault_client import VaultError
+
+
+class FakeVault:
+    """Stands in for VaultClient; only tokens in ``valid`` pass lookup-self."""
+
+    def __init__(self, *valid: str):
+        self.valid = set(valid)
+        self.token = None
+        self.lookups = 0
+        self.logins = 0
+
+    def set_token(self, token):
+        self.token = token
+
+    def is_authenticated(self):
+        self.lookups += 1
+        return self.token in self.valid
+
+    def approle_login(self, role_id, secret_id, mount="approle"):
+        self.logins += 1
+        self.valid.add("s.approle")
+        return {"auth": {"client_token": "s.approle", "lease_duration": 3600}}
+
+
+@pytest.fixture
+def vault(monkeypatch):
+    client = FakeVault()
+    monkeypatch.setattr(auth, "get_client", lambda: client)
+    monkeypatch.setattr(settings, "approle_role_id", "role")
+    monkeypatch.setattr(settings, "approle_secret_id", "secret")
+    settings.ensure_dirs()
+    return client
+
+
+def test_fresh_cached_token_is_used_without_lookup(vault):
+    settings.write_token_cache("s.cached", 3600)
+
+    assert auth.authenticate() is vault
+    assert vault.token == "s.cached"
+    assert vault.lookups == 0
+    assert vault.logins == 0
+
+
+def test_expired_cached_token_falls_back_to_approle(vault):
+    settings.write_token_cache("s.old", 1)
+
+    assert auth.authenticate() is vault
+    assert vault.token == "s.approle"
+    assert vault.logins == 1
+    assert settings.read_token_cache()[0] == "s.approle"
+
+
+def test_with_client_reauthenticates_once_on_rejected_token(vault):
+    # Still within its cached lifetime, but revoked on the server
+    settings.write_token_cache("s.revoked", 3600)
+    tokens = []
+
+    def call(client):
+        tokens.append(client.token)
+        if client.token not in client.valid:
+            raise VaultError("permission denied", 403)
+        return "ok"
+
+    assert auth.with_client(call) == "ok"
+    assert tokens == ["s.revoked", "s.approle"]
+    assert settings.read_token_cache()[0] == "s.approle"
+
+
+def test_with_client_does_not_retry_policy_denial(vault):
+    vault.valid.add("s.cached")
+    settings.write_token_cache("s.cached", 3600)
+    calls = []
+
+    def call(client):
+        calls.append(client.token)
+        raise VaultError("permission denied", 403)
+
+    with pytest.raises(VaultError):
+        auth.with_client(call)
+    assert calls == ["s.cached"]
+    assert vault.logins == 0
@@ -0,0 +1,50 @@
+"""Tests for the top-level CLI wiring."""
+
+import inspect
+import io
+
+import pytest
+import typer
+
+from vaultctl.cli import LazyTyperGroup, app
+
+
+@pytest.mark.parametrize("name", list(LazyTyperGroup.lazy_commands))
+def test_lazy_stub_help_matches_target(name):
+    """The stub shown by --help must not drift from the real command."""
+    group = typer.main.get_group(app)
+    command = group._load_command(name)
+    help_text = command.short_help or inspect.cleandoc(command.help or "").split("\n\n")[0]
+    assert " ".join(help_text.split()) == LazyTyperGroup.lazy_commands[name][1]
+
+
+def test_help_lists_eager_commands_first():
+    group = typer.main.get_group(app)
+    names = group.list_commands(typer.Context(group))
+    assert names[:4] == ["init", "env", "status", "config"]
+    assert names[4:] == list(LazyTyperGroup.lazy_commands)
+
+
+def test_init_answers_env_overrides_stdin(monkeypatch):
+    from vaultctl.cli import _load_init_answers
+
+    stdin = '{"vault_addr": "https://stdin", "kv_path": "from/stdin", "role_name": null, "unknown": "x", "merge_env": true}'
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    monkeypatch.setenv("VAULTCTL_INIT_KV_PATH", "from/env")
+    monkeypatch.setenv("VAULTCTL_INIT_SECRET_NAME", "100")
+    monkeypatch.delenv("VAULTCTL_INIT_VAULT_ADDR", raising=False)
+
+    assert _load_init_answers() == {
+        "vault_addr": "https://stdin",
+        "kv_path": "from/env",
+        "merge_env": "True",
+        "secret_name": "100",
+    }
+
+
+def test_init_answers_reject_non_object_json(monkeypatch):
+    from vaultctl.cli import _load_init_answers
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("[1, 2]"))
+    with pytest.raises(typer.Exit):
+        _load_init_answers()
@@ -0,0 +1,56 @@
+"""Tests for the token cache."""
+
+import os
+import stat
+import time
+
+import pytest
+
+from vaultctl.config import settings
+
+
+def _write_cache(content: str) -> None:
+    settings.ensure_dirs()
+    settings.token_cache_file.write_text(content)
+
+
+def test_token_cache_round_trip():
+    settings.ensure_dirs()
+    before = time.time()
+    settings.write_token_cache("s.abc", 3600)
+
+    token, expires_at = settings.read_token_cache()
+    assert token == "s.abc"
+    assert before + 3600 <= expires_at <= time.time() + 3600
+    assert stat.S_IMODE(os.stat(settings.token_cache_file).st_mode) == 0o600
+
+
+def test_token_cache_without_lease_has_no_expiry():
+    settings.ensure_dirs()
+    settings.write_token_cache("s.abc", 0)
+    assert settings.read_token_cache() == ("s.abc", None)
+
+
+def test_legacy_bare_token_is_read_with_unknown_expiry():
+    _write_cache("s.legacy\n")
+    assert settings.read_token_cache() == ("s.legacy", None)
+
+
+@pytest.mark.parametrize("expires_at", ['"soon"', "true", "null", "[1]"])
+def test_non_numeric_expiry_is_ignored(expires_at):
+    _write_cache(f'{{"token": "s.abc", "expires_at": {expires_at}}}')
+    assert settings.read_token_cache() == ("s.abc", None)
+
+
+@pytest.mark.parametrize("content", ["", "{not json", '{"expires_at": 1}'])
+def test_unusable_cache_yields_no_token(content):
+    _write_cache(content)
+    assert settings.read_token_cache()[0] is None
+
+
+def test_missing_cache_and_clear():
+    assert settings.read_token_cache() == (None, None)
+    settings.ensure_dirs()
+    settings.write_token_cache("s.abc", 60)
+    settings.clear_token_cache()
+    assert settings.read_token_cache() == (None, None)
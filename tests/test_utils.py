@@ -0,0 +1,25 @@
+"""Tests for env file helpers."""
+
+import os
+import stat
+
+from vaultctl.utils import load_env_file, write_env_file
+
+
+def test_write_env_file_creates_owner_only_file(tmp_path):
+    path = tmp_path / ".env.secrets"
+    write_env_file(str(path), {"DB_PASS": "p@ss word", "TOKEN": "abc"}, header="test")
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert load_env_file(str(path)) == {"DB_PASS": "p@ss word", "TOKEN": "abc"}
+
+
+def test_write_env_file_tightens_existing_file(tmp_path):
+    path = tmp_path / ".env.secrets"
+    path.write_text("OLD=1\n")
+    path.chmod(0o644)
+
+    write_env_file(str(path), {"NEW": "2"})
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert load_env_file(str(path)) == {"NEW": "2"}
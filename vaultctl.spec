@@ -22,6 +22,7 @@ a = Analysis(
         # vaultctl 모듈
         "vaultctl",
         "vaultctl.cli",
+        "vaultctl.auth",
         "vaultctl.config",
         "vaultctl.vault_client",
         "vaultctl.utils",
@@ -29,6 +30,7 @@ a = Analysis(
         # commands package
         "vaultctl.commands",
         "vaultctl.commands.setup",
+        "vaultctl.commands.selfupdate",
         # admin subpackage
         "vaultctl.commands.admin",
         "vaultctl.commands.admin.secrets",